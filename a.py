@@ -1,506 +1,674 @@
+import hashlib
 import os
+import shlex
 import sys
+from collections import deque
 from pathlib import Path
 
-def create_directory_tree(base_path: Path, tree: dict, ignore_files: set = None):
+# Common placeholders we skip content for
+_IGNORE_FILES = frozenset({'README.md', 'Cargo.toml', 'CMakeLists.txt', '.gitignore', 'LICENSE.md'})
+
+# open(2) flags for empty placeholders (keep existing content, like touch) and payload files
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT
+_TRUNCATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Files are created relative to an fd for their parent directory where the platform allows it
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_PATH', 0)
+
+# Placeholder comment prefix for code files, keyed by extension
+_CODE_COMMENT = {
+    '.rs': b"// TODO: Implement ",
+    '.cpp': b"// TODO: Implement ",
+    '.h': b"// TODO: Implement ",
+    '.py': b"// TODO: Implement ",
+    '.lua': b"// TODO: Implement ",
+}
+
+# The scaffold as nested (name, entry) tuples: entry is a tuple of children for a
+# directory, None for an empty file, or bytes for a file with fixed content
+_TREE = (
+    ("lucid-engine", (
+        ("LICENSE.md",
+            b"Lucid Engine License\n\nSource-available: Use per EULA. Royalties apply post $1M revenue.\nSDK portions MIT."
+        ),
+        ("README.md",
+            b"# Lucid Engine\n\nSource-available game engine. See LICENSE.md for terms.\n\n## Setup\ncargo build --workspace\ncmake ..\n"
+        ),
+        ("build", (
+            ("CMakeLists.txt", None),
+            ("lucid-stack-builder.py",  # Placeholder Python script
+                b"#!/usr/bin/env python3\n\nimport os\n\n# Auto-generate build configs\nprint('Building Lucid stacks...')\n# TODO: Implement\n"
+            ),
+            ("Cargo.toml", None),
+            ("platform", (
+                ("android.toml", None),
+                ("vulkan-cmake", None),
+            )),
+            ("dist", (
+                ("lucid-trial.zip", None),  # Placeholder
+                ("lucid-full-src.tar.gz", None),
+            )),
+        )),
+        ("workspaces", (
+            ("Cargo.toml", None),
+            ("meta", (  # Meta crates
+                ("unicity", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("graph.rs", None),
+                        ("reflection.rs", None),
+                    )),
+                    ("examples", (
+                        ("dep_viz.rs", None),
+                    )),
+                    ("tests", (
+                        ("graph_cycle_test.rs", None),
+                    )),
+                )),
+                ("serializer", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("stream.rs", None),
+                    )),
+                    ("examples", (
+                        ("replay_demo.rs", None),
+                    )),
+                )),
+                ("editor", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("imgui_panels.rs", None),
+                        ("fusion_mode.rs", None),
+                    )),
+                    ("examples", (
+                        ("live_debug.rs", None),
+                    )),
+                )),
+                ("neural", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("models.rs", None),
+                        ("suggestions.rs", None),
+                    )),
+                    ("examples", (
+                        ("prompt_gen.rs", None),
+                    )),
+                )),
+                ("qiss", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("orchestrator.rs", None),
+                    )),
+                    ("examples", (
+                        ("cloud_preview.rs", None),
+                    )),
+                )),
+                ("link", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("rollback.rs", None),
+                    )),
+                    ("examples", (
+                        ("mp_sync.rs", None),
+                    )),
+                )),
+                ("sdk", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("lib.rs", None),
+                        ("templates", (
+                            ("quantum_stack.rs", None),
+                        )),
+                    )),
+                    ("examples", (
+                        ("custom_stack.rs", None),
+                    )),
+                )),
+            )),
+            ("rust", (
+                ("lucid-ffi", (
+                    ("Cargo.toml", None),
+                    ("src", (
+                        ("ffi.rs", None),
+                    )),
+                )),
+            )),
+        )),
+        ("stacks", (
+            ("Lucid-Illuminati", (
+                ("src", (
+                    ("core", (
+                        ("LI_SceneGraph.cpp", None),
+                        ("LI_PostProcess.cpp", None),
+                    )),
+                    ("features", (
+                        ("RayTracing", (
+                            ("LI_PathTracer.cpp", None),
+                            ("LI_VXGI.cpp", None),
+                        )),
+                        ("Volumetrics", (
+                            ("LI_FogRenderer.cpp", None),
+                        )),
+                        ("GPUCompute", (
+                            ("LI_ParticleShaders.cpp", None),
+                        )),
+                        ("NeuralShaders", (
+                            ("LI_NeuralGen.cpp", None),  # Horizon placeholder
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LI_ShaderVaultImporter.py", None),
+                    )),
+                    ("meta-hooks", (
+                        ("LI_EntityStream.cpp", None),
+                    )),
+                )),
+                ("include", ()),  # Empty dir
+                ("tests", ()),  # Empty dir
+                ("bindings", ()),  # Empty dir
+            )),
+            ("Lucid-Disassembly", (
+                ("src", (
+                    ("core", (
+                        ("LD_RigidBody.cpp", None),
+                        ("LD_Collision.cpp", None),
+                    )),
+                    ("features", (
+                        ("Destructibles", (
+                            ("LD_ProceduralDebris.cpp", None),
+                            ("LD_ForceFields.cpp", None),
+                        )),
+                        ("Fluids", (
+                            ("LD_ParticleFluids.cpp", None),
+                        )),
+                        ("Vehicles", (
+                            ("LD_CharacterPhysics.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LD_PhysicsDebugger.py", None),
+                    )),
+                    ("meta-hooks", (
+                        ("LD_ReplayBuffer.cpp", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            # Abbreviating other stacks for brevity; expand similarly
+            ("Lucid-Harmonia", (
+                ("src", (
+                    ("core", (
+                        ("LH_SpatialMixer.cpp", None),
+                        ("LH_EffectsBus.cpp", None),
+                    )),
+                    ("features", (
+                        ("Procedural", (
+                            ("LH_DynamicTracks.cpp", None),
+                        )),
+                        ("PhysicsIntegration", (
+                            ("LH_EnvInteraction.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LH_AudioImporter.py", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            ("Lucid-Diffuser", (
+                ("src", (
+                    ("core", (
+                        ("LD_InputMapper.cpp", None),
+                        ("LD_NetSync.cpp", None),
+                    )),
+                    ("features", (
+                        ("Multiplayer", (
+                            ("LD_RPCSystem.cpp", None),
+                        )),
+                        ("HotReload", (
+                            ("LD_ConfigReloader.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LD_VRTracker.py", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            ("Lucid-Charisma", (
+                ("src", (
+                    ("core", (
+                        ("LC_SkeletalRig.cpp", None),
+                        ("LC_StateMachine.cpp", None),
+                    )),
+                    ("features", (
+                        ("Procedural", (
+                            ("LC_MotionBlending.cpp", None),
+                        )),
+                        ("Facial", (
+                            ("LC_MorphTargets.cpp", None),
+                        )),
+                        ("Ragdoll", (
+                            ("LC_PhysicsRagdoll.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LC_AnimImporter.py", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            ("Lucid-Ekpyrosa", (
+                ("src", (
+                    ("core", (
+                        ("LE_SceneEditor.cpp", None),
+                        ("LE_ScriptAPI.cpp", None),
+                    )),
+                    ("features", (
+                        ("Procedural", (
+                            ("LE_TerrainGen.cpp", None),
+                            ("LE_WorldPartition.cpp", None),
+                        )),
+                        ("Debugging", (
+                            ("LE_PerfVisualizer.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LE_AssetPipeline.py", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            ("Lucid-Alrena", (
+                ("src", (
+                    ("core", (
+                        ("LA_BehaviorTree.cpp", None),
+                        ("LA_Pathfinder.cpp", None),
+                    )),
+                    ("features", (
+                        ("Procedural", (
+                            ("LA_ContentGen.cpp", None),
+                        )),
+                        ("Adaptive", (
+                            ("LA_LearningNPCs.cpp", None),
+                        )),
+                        ("EventHooks", (
+                            ("LA_GameLogic.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LA_AIDebugger.py", None),
+                    )),
+                    ("meta-hooks", (
+                        ("LA_NeuralAdapt.cpp", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+            ("Lucid-LaunchPad", (
+                ("src", (
+                    ("core", (
+                        ("LLP_BuildSystem.cpp", None),
+                        ("LLP_Packager.cpp", None),
+                    )),
+                    ("features", (
+                        ("HotPatching", (
+                            ("LLP_Incremental.cpp", None),
+                        )),
+                        ("Profiling", (
+                            ("LLP_Telemetry.cpp", None),
+                        )),
+                        ("Marketplace", (
+                            ("LLP_PluginSystem.cpp", None),
+                        )),
+                    )),
+                    ("pipelines", (
+                        ("LLP_ExportRunner.py", None),
+                    )),
+                )),
+                ("include", ()),
+                ("tests", ()),
+                ("bindings", ()),
+            )),
+        )),
+        ("core", (
+            ("src", (
+                ("Core_ECS.cpp", None),
+                ("Core_UnicityBridge.cpp", None),
+                ("Core_QissTelemetry.cpp", None),
+            )),
+            ("include", ()),
+            ("archetypes", (
+                ("SerializableDestructible.ecs", None),
+                ("NeuralNPC.ecs", None),
+            )),
+        )),
+        ("plugins", (
+            ("Lucid-QuantumExt", (
+                ("src", ()),
+            )),
+            ("Lucid-VRExt", (
+                ("src", ()),
+            )),
+        )),
+    )),
+    ("Content", (
+        ("Meta", (
+            ("EditorThemes", ()),
+            ("Models", (
+                ("shader_gen.torch", None),  # Placeholder ML model
+            )),
+        )),
+        ("Blueprints", (
+            ("Meta", ()),
+            ("Alrena", (
+                ("BT_AdaptiveGuard.uasset", None),
+            )),
+            ("Charisma", ()),
+        )),
+        ("Meshes", (
+            ("Illuminati", ()),
+            ("Disassembly", ()),
+            ("Ekpyrosa", ()),
+        )),
+        ("Materials", (
+            ("Procedural", ()),
+        )),
+        ("Sounds", (
+            ("Procedural", ()),
+        )),
+        ("Maps", (
+            ("PhysicsDemo", ()),
+            ("AIDemo", ()),
+        )),
+        ("Animations", (
+            ("Facial", ()),
+        )),
+        ("Textures", ()),
+    )),
+    ("Source", (
+        ("MyLucidGame", (
+            ("Private", (
+                ("GameOrchestrator.cpp", None),
+                ("MP_Session.cpp", None),
+                ("GameWorld.cpp", None),
+                ("CustomAlrena.cpp", None),
+            )),
+            ("Public", ()),
+        )),
+        ("Stacks-Overrides", (
+            ("Disassembly", ()),
+            ("Neural", ()),
+        )),
+    )),
+    ("Config", (
+        ("meta", (
+            ("Unicity.yaml", None),
+            ("Serializer-Versioning.ini", None),
+            ("Editor-Docks.ini", None),
+            ("Neural-Prompts.toml", None),
+            ("Qiss-Cloud.yaml", None),
+            ("Link-Protocol.ini", None),
+            ("License-Auth.ini", None),
+        )),
+        ("stack-overrides", (
+            ("Illuminati-RayTracing.ini", None),
+            ("Disassembly-Fluids.yaml", None),
+            ("Harmonia-Spatial.yaml", None),
+            ("Diffuser-Net.ini", None),
+            ("Charisma-Anim.ini", None),
+            ("Ekpyrosa-PCG.yaml", None),
+            ("Alrena-Behavior.yaml", None),
+            ("LaunchPad-Build.ini", None),
+        )),
+        ("cross-stack", (
+            ("ECS-Archetypes.yaml", None),
+        )),
+        ("DefaultEngine.ini", None),
+    )),
+    ("Builds", (
+        ("target", (
+            ("debug", ()),
+        )),
+        ("cloud", ()),
+        ("Windows", (
+            ("MyLucidGame.exe", None),
+        )),
+        ("Android", ()),
+        ("Web", ()),
+    )),
+    ("Docs", (
+        ("Meta-Overview.md", None),
+        ("Rust-Interop.md", None),
+        ("SDK-Examples.md", None),
+        ("Licensing-Model.md", None),
+        ("Lucid-Illuminati-Features.md", None),
+        ("Cross-Stack-Synergies.md", None),
+    )),
+    ("Telemetry", (
+        ("session-2025-10-07.json", None),
+    )),
+    ("examples", (
+        ("lucid-mp-demo", (
+            ("Cargo.toml", None),
+            ("src", (
+                ("main.rs", None),
+            )),
+        )),
+    )),
+    (".gitignore",
+        b"# Builds\nbuilds/\ntarget/\n\n# Content temps\nContent/*.tmp\n\n# IDE\n.vscode/\n.idea/\n\n# Logs\nTelemetry/*.log\n"
+    ),
+)
+
+# Fingerprint of everything that decides the scaffold's contents, recorded in
+# the stamp file so an unchanged re-run can exit early
+_TREE_HASH = hashlib.blake2b(
+    repr((_TREE, _CODE_COMMENT, sorted(_IGNORE_FILES))).encode(), digest_size=16
+).hexdigest()
+
+def _flatten(tree: tuple, ignore_files: set):
     """
-    Recursively create directories and placeholder files from a nested dict representation of the tree.
-    dict keys are dir/file names; values are dicts for subtrees or None for empty dirs/files.
+    Walk the nested tree breadth-first and return two flat lists relative to the
+    tree root: directory paths (parent-first) and (parent, name, payload) entries
+    for files, where parent is "" or a directory path ending in os.sep. payload is
+    the bytes to write, or None for an empty file.
     """
-    if ignore_files is None:
-        ignore_files = {'README.md', 'Cargo.toml', 'CMakeLists.txt', '.gitignore', 'LICENSE.md'}  # Common placeholders we skip content for
-
-    for name, subtree in tree.items():
-        path = base_path / name
-        if subtree is None:  # File
-            if name not in ignore_files:
-                path.touch()
+    dirs, files = [], []
+    queue = deque([("", tree)])
+    while queue:
+        prefix, subtree = queue.popleft()
+        for name, child in subtree:
+            path = prefix + name
+            if isinstance(child, bytes):  # File with fixed content
+                files.append((prefix, name, child))
+            elif child is None:  # File
                 # Add basic placeholder content for code files
-                if name.endswith(('.rs', '.cpp', '.h', '.py', '.lua')):
-                    with open(path, 'w') as f:
-                        f.write(f"// TODO: Implement {name}\n")
+                ext = name[name.rfind('.'):]
+                if ext in _CODE_COMMENT and name not in ignore_files:
+                    files.append((prefix, name, _CODE_COMMENT[ext] + name.encode() + b"\n"))
+                else:
+                    files.append((prefix, name, None))  # Empty for configs, licenses, etc.
+            else:  # Directory
+                dirs.append(path)
+                if child:
+                    queue.append((path + os.sep, child))
+    return dirs, files
+
+def _plan(tree: tuple, ignore_files: set):
+    """
+    Reduce a tree to the relative leaf directories to create and the files to write,
+    so callers only join paths onto their base. Files come back as (parent, entries)
+    groups with entries of (name, payload), ordered so every parent directory follows
+    its ancestors and all of a directory's descendants are contiguous.
+    """
+    dirs, files = _flatten(tree, ignore_files)
+    # Only the deepest directories need creating; makedirs fills in their parents.
+    # dirs comes out of the BFS already sorted by depth, so filtering it in place
+    # keeps a stable shallowest-first order without a separate sort.
+    parents = {os.path.dirname(path) for path in dirs}
+    groups = {}
+    for parent, name, content in files:
+        groups.setdefault(parent, []).append((name, content))
+    return (
+        [path for path in dirs if path not in parents],
+        [(parent, groups[parent]) for parent in sorted(groups, key=lambda p: p.split(os.sep))],
+    )
+
+def _create_file(path: str, content: bytes, dir_fd: int = None):
+    """Create one file, writing `content` unless it is None."""
+    # Empty files are created without truncating, like touch, but skip the extra utime call
+    fd = os.open(path, _CREATE_FLAGS if content is None else _TRUNCATE_FLAGS, 0o644, dir_fd=dir_fd)
+    try:
+        if content is not None:
+            os.write(fd, content)
+    finally:
+        os.close(fd)
+
+def _makedirs(path: str, created: set):
+    """os.makedirs, skipped when `created` already records the directory."""
+    if path in created:
+        return
+    os.makedirs(path, exist_ok=True)
+    # Record the ancestors too, so later calls sharing them stay off the filesystem
+    while path and path not in created:
+        created.add(path)
+        path = os.path.dirname(path)
+
+def create_directory_tree(base_path: str, tree: tuple, ignore_files: set = _IGNORE_FILES,
+                          created: set = None):
+    """
+    Create directories and placeholder files from a nested tuple representation of the tree.
+    Each entry is a (name, value) pair; values are tuples of entries for subtrees, None for
+    empty files, or bytes for files with fixed content.
+    The tree is flattened first so all directories are created before any file is written.
+    Pass the same `created` set to repeated calls to skip directories made by earlier ones.
+    """
+    if created is None:
+        created = set()
+    leaf_dirs, groups = _plan(tree, ignore_files)
+    prefix = base_path + os.sep
+
+    for path in leaf_dirs:
+        _makedirs(prefix + path, created)
+
+    if not _DIR_FD_SUPPORTED:
+        for parent, entries in groups:
+            for name, content in entries:
+                _create_file(prefix + parent + name, content)
+        return
+    # Keep an fd open for each directory on the current path only. Every directory
+    # is opened relative to its parent's fd and every file relative to its own
+    # directory's, so the kernel resolves a single component each time, while at
+    # most depth + 1 fds are open however wide the tree is.
+    stack = [("", os.open(base_path, _DIR_FLAGS))]
+    try:
+        for parent, entries in groups:
+            while not parent.startswith(stack[-1][0]):
+                os.close(stack.pop()[1])
+            for name in parent[len(stack[-1][0]):].split(os.sep)[:-1]:
+                stack.append((stack[-1][0] + name + os.sep,
+                              os.open(name, _DIR_FLAGS, dir_fd=stack[-1][1])))
+            for name, content in entries:
+                _create_file(name, content, stack[-1][1])
+    finally:
+        for _, fd in stack:
+            os.close(fd)
+
+def _printf_format(content: bytes) -> str:
+    """
+    Spell out `content` as a printf format that reproduces it byte for byte: printable
+    ASCII stays literal, newlines become \\n and everything else, including the
+    quote, backslash and percent characters, becomes a three-digit octal escape.
+    """
+    return "".join(
+        "\\n" if byte == 0x0A else
+        chr(byte) if 0x20 <= byte < 0x7F and byte not in b"'\\%" else
+        f"\\{byte:03o}"
+        for byte in content
+    )
+
+def generate_shell_script(tree: tuple = _TREE, ignore_files: set = _IGNORE_FILES) -> str:
+    """
+    Render the scaffold as a standalone POSIX sh script taking the project name as $1.
+    Everything is resolved up front: one mkdir -p for all leaf directories, then a
+    single redirection or printf per file, so no Python is needed at scaffold time.
+    Payloads are written byte for byte via octal escapes, so any bytes content,
+    including NUL and non-UTF-8 data, comes out the same as from create_directory_tree.
+    Run: python scaffold_lucid.py --emit-sh > scaffold_lucid_generated.sh
+    """
+    leaf_dirs, groups = _plan(tree, ignore_files)
+    lines = [
+        "#!/bin/sh",
+        "# Generated by scaffold_lucid.py --emit-sh; do not edit.",
+        "set -e",
+        'base="${1:-MyLucidGame}"',
+        'mkdir -p -- "$base"',
+        'cd -- "$base"',
+    ]
+    # _TREE_HASH only describes the default scaffold, so only stamp that one
+    stamped = tree is _TREE and ignore_files == _IGNORE_FILES
+    if stamped:
+        lines.append(f'[ "$(cat .scaffold-stamp 2>/dev/null)" = {_TREE_HASH} ] && exit 0')
+    if leaf_dirs:
+        lines.append("mkdir -p -- " + " ".join(shlex.quote(path.replace(os.sep, "/")) for path in leaf_dirs))
+    for parent, entries in groups:
+        for name, content in entries:
+            path = shlex.quote((parent + name).replace(os.sep, "/"))
+            if content is None:
+                lines.append(f": >> {path}")  # Keep existing content, like touch
             else:
-                path.touch()  # Empty for configs, licenses, etc.
-        else:  # Directory
-            path.mkdir(exist_ok=True)
-            if isinstance(subtree, dict):
-                create_directory_tree(path, subtree)
+                lines.append(f"printf '{_printf_format(content)}' > {path}")
+    if stamped:
+        lines.append(f"printf '%s' {_TREE_HASH} > .scaffold-stamp")
+    return "\n".join(lines) + "\n"
 
 def main(project_name: str = "MyLucidGame"):
     """
     Scaffold the Lucid Engine file structure.
     Run: python scaffold_lucid.py [project_name]
+    Or emit an equivalent shell script: python scaffold_lucid.py --emit-sh
     """
     base = Path(project_name)
+    stamp = base / ".scaffold-stamp"
+    try:
+        if stamp.read_text() == _TREE_HASH:
+            print(f"Lucid Engine already scaffolded in {base.absolute()}")
+            return
+    except OSError:
+        pass  # Not scaffolded yet, or by an older tree
     base.mkdir(exist_ok=True)
+    created = {str(base)}
 
-    # Define the tree as a nested dict (dir: {sub: ...}, file: None)
-    tree = {
-        "lucid-engine": {
-            "LICENSE.md": None,
-            "README.md": None,
-            "build": {
-                "CMakeLists.txt": None,
-                "lucid-stack-builder.py": None,  # Placeholder Python script
-                "Cargo.toml": None,
-                "platform": {
-                    "android.toml": None,
-                    "vulkan-cmake": None,
-                },
-                "dist": {
-                    "lucid-trial.zip": None,  # Placeholder
-                    "lucid-full-src.tar.gz": None,
-                },
-            },
-            "workspaces": {
-                "Cargo.toml": None,
-                "meta": {  # Meta crates
-                    "unicity": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "graph.rs": None,
-                            "reflection.rs": None,
-                        },
-                        "examples": {
-                            "dep_viz.rs": None,
-                        },
-                        "tests": {
-                            "graph_cycle_test.rs": None,
-                        },
-                    },
-                    "serializer": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "stream.rs": None,
-                        },
-                        "examples": {
-                            "replay_demo.rs": None,
-                        },
-                    },
-                    "editor": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "imgui_panels.rs": None,
-                            "fusion_mode.rs": None,
-                        },
-                        "examples": {
-                            "live_debug.rs": None,
-                        },
-                    },
-                    "neural": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "models.rs": None,
-                            "suggestions.rs": None,
-                        },
-                        "examples": {
-                            "prompt_gen.rs": None,
-                        },
-                    },
-                    "qiss": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "orchestrator.rs": None,
-                        },
-                        "examples": {
-                            "cloud_preview.rs": None,
-                        },
-                    },
-                    "link": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "rollback.rs": None,
-                        },
-                        "examples": {
-                            "mp_sync.rs": None,
-                        },
-                    },
-                    "sdk": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "lib.rs": None,
-                            "templates": {
-                                "quantum_stack.rs": None,
-                            },
-                        },
-                        "examples": {
-                            "custom_stack.rs": None,
-                        },
-                    },
-                },
-                "rust": {
-                    "lucid-ffi": {
-                        "Cargo.toml": None,
-                        "src": {
-                            "ffi.rs": None,
-                        },
-                    },
-                },
-            },
-            "stacks": {
-                "Lucid-Illuminati": {
-                    "src": {
-                        "core": {
-                            "LI_SceneGraph.cpp": None,
-                            "LI_PostProcess.cpp": None,
-                        },
-                        "features": {
-                            "RayTracing": {
-                                "LI_PathTracer.cpp": None,
-                                "LI_VXGI.cpp": None,
-                            },
-                            "Volumetrics": {
-                                "LI_FogRenderer.cpp": None,
-                            },
-                            "GPUCompute": {
-                                "LI_ParticleShaders.cpp": None,
-                            },
-                            "NeuralShaders": {
-                                "LI_NeuralGen.cpp": None,  # Horizon placeholder
-                            },
-                        },
-                        "pipelines": {
-                            "LI_ShaderVaultImporter.py": None,
-                        },
-                        "meta-hooks": {
-                            "LI_EntityStream.cpp": None,
-                        },
-                    },
-                    "include": {},  # Empty dir
-                    "tests": {},  # Empty dir
-                    "bindings": {},  # Empty dir
-                },
-                "Lucid-Disassembly": {
-                    "src": {
-                        "core": {
-                            "LD_RigidBody.cpp": None,
-                            "LD_Collision.cpp": None,
-                        },
-                        "features": {
-                            "Destructibles": {
-                                "LD_ProceduralDebris.cpp": None,
-                                "LD_ForceFields.cpp": None,
-                            },
-                            "Fluids": {
-                                "LD_ParticleFluids.cpp": None,
-                            },
-                            "Vehicles": {
-                                "LD_CharacterPhysics.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LD_PhysicsDebugger.py": None,
-                        },
-                        "meta-hooks": {
-                            "LD_ReplayBuffer.cpp": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                # Abbreviating other stacks for brevity; expand similarly
-                "Lucid-Harmonia": {
-                    "src": {
-                        "core": {
-                            "LH_SpatialMixer.cpp": None,
-                            "LH_EffectsBus.cpp": None,
-                        },
-                        "features": {
-                            "Procedural": {
-                                "LH_DynamicTracks.cpp": None,
-                            },
-                            "PhysicsIntegration": {
-                                "LH_EnvInteraction.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LH_AudioImporter.py": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                "Lucid-Diffuser": {
-                    "src": {
-                        "core": {
-                            "LD_InputMapper.cpp": None,
-                            "LD_NetSync.cpp": None,
-                        },
-                        "features": {
-                            "Multiplayer": {
-                                "LD_RPCSystem.cpp": None,
-                            },
-                            "HotReload": {
-                                "LD_ConfigReloader.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LD_VRTracker.py": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                "Lucid-Charisma": {
-                    "src": {
-                        "core": {
-                            "LC_SkeletalRig.cpp": None,
-                            "LC_StateMachine.cpp": None,
-                        },
-                        "features": {
-                            "Procedural": {
-                                "LC_MotionBlending.cpp": None,
-                            },
-                            "Facial": {
-                                "LC_MorphTargets.cpp": None,
-                            },
-                            "Ragdoll": {
-                                "LC_PhysicsRagdoll.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LC_AnimImporter.py": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                "Lucid-Ekpyrosa": {
-                    "src": {
-                        "core": {
-                            "LE_SceneEditor.cpp": None,
-                            "LE_ScriptAPI.cpp": None,
-                        },
-                        "features": {
-                            "Procedural": {
-                                "LE_TerrainGen.cpp": None,
-                                "LE_WorldPartition.cpp": None,
-                            },
-                            "Debugging": {
-                                "LE_PerfVisualizer.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LE_AssetPipeline.py": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                "Lucid-Alrena": {
-                    "src": {
-                        "core": {
-                            "LA_BehaviorTree.cpp": None,
-                            "LA_Pathfinder.cpp": None,
-                        },
-                        "features": {
-                            "Procedural": {
-                                "LA_ContentGen.cpp": None,
-                            },
-                            "Adaptive": {
-                                "LA_LearningNPCs.cpp": None,
-                            },
-                            "EventHooks": {
-                                "LA_GameLogic.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LA_AIDebugger.py": None,
-                        },
-                        "meta-hooks": {
-                            "LA_NeuralAdapt.cpp": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-                "Lucid-LaunchPad": {
-                    "src": {
-                        "core": {
-                            "LLP_BuildSystem.cpp": None,
-                            "LLP_Packager.cpp": None,
-                        },
-                        "features": {
-                            "HotPatching": {
-                                "LLP_Incremental.cpp": None,
-                            },
-                            "Profiling": {
-                                "LLP_Telemetry.cpp": None,
-                            },
-                            "Marketplace": {
-                                "LLP_PluginSystem.cpp": None,
-                            },
-                        },
-                        "pipelines": {
-                            "LLP_ExportRunner.py": None,
-                        },
-                    },
-                    "include": {},
-                    "tests": {},
-                    "bindings": {},
-                },
-            },
-            "core": {
-                "src": {
-                    "Core_ECS.cpp": None,
-                    "Core_UnicityBridge.cpp": None,
-                    "Core_QissTelemetry.cpp": None,
-                },
-                "include": {},
-                "archetypes": {
-                    "SerializableDestructible.ecs": None,
-                    "NeuralNPC.ecs": None,
-                },
-            },
-            "plugins": {
-                "Lucid-QuantumExt": {
-                    "src": {},
-                },
-                "Lucid-VRExt": {
-                    "src": {},
-                },
-            },
-        },
-        "Content": {
-            "Meta": {
-                "EditorThemes": {},
-                "Models": {
-                    "shader_gen.torch": None,  # Placeholder ML model
-                },
-            },
-            "Blueprints": {
-                "Meta": {},
-                "Alrena": {
-                    "BT_AdaptiveGuard.uasset": None,
-                },
-                "Charisma": {},
-            },
-            "Meshes": {
-                "Illuminati": {},
-                "Disassembly": {},
-                "Ekpyrosa": {},
-            },
-            "Materials": {
-                "Procedural": {},
-            },
-            "Sounds": {
-                "Procedural": {},
-            },
-            "Maps": {
-                "PhysicsDemo": {},
-                "AIDemo": {},
-            },
-            "Animations": {
-                "Facial": {},
-            },
-            "Textures": {},
-        },
-        "Source": {
-            "MyLucidGame": {
-                "Private": {
-                    "GameOrchestrator.cpp": None,
-                    "MP_Session.cpp": None,
-                    "GameWorld.cpp": None,
-                    "CustomAlrena.cpp": None,
-                },
-                "Public": {},
-            },
-            "Stacks-Overrides": {
-                "Disassembly": {},
-                "Neural": {},
-            },
-        },
-        "Config": {
-            "meta": {
-                "Unicity.yaml": None,
-                "Serializer-Versioning.ini": None,
-                "Editor-Docks.ini": None,
-                "Neural-Prompts.toml": None,
-                "Qiss-Cloud.yaml": None,
-                "Link-Protocol.ini": None,
-                "License-Auth.ini": None,
-            },
-            "stack-overrides": {
-                "Illuminati-RayTracing.ini": None,
-                "Disassembly-Fluids.yaml": None,
-                "Harmonia-Spatial.yaml": None,
-                "Diffuser-Net.ini": None,
-                "Charisma-Anim.ini": None,
-                "Ekpyrosa-PCG.yaml": None,
-                "Alrena-Behavior.yaml": None,
-                "LaunchPad-Build.ini": None,
-            },
-            "cross-stack": {
-                "ECS-Archetypes.yaml": None,
-            },
-            "DefaultEngine.ini": None,
-        },
-        "Builds": {
-            "target": {
-                "debug": {},
-            },
-            "cloud": {},
-            "Windows": {
-                "MyLucidGame.exe": None,
-            },
-            "Android": {},
-            "Web": {},
-        },
-        "Docs": {
-            "Meta-Overview.md": None,
-            "Rust-Interop.md": None,
-            "SDK-Examples.md": None,
-            "Licensing-Model.md": None,
-            "Lucid-Illuminati-Features.md": None,
-            "Cross-Stack-Synergies.md": None,
-        },
-        "Telemetry": {
-            "session-2025-10-07.json": None,
-        },
-        "examples": {
-            "lucid-mp-demo": {
-                "Cargo.toml": None,
-                "src": {
-                    "main.rs": None,
-                },
-            },
-        },
-        ".gitignore": None,
-    }
-
-    create_directory_tree(base, tree)
-
-    # Add some basic content to key placeholders
-    (base / "lucid-engine" / "README.md").write_text(
-        "# Lucid Engine\n\nSource-available game engine. See LICENSE.md for terms.\n\n## Setup\ncargo build --workspace\ncmake ..\n"
-    )
-    (base / "lucid-engine" / "LICENSE.md").write_text(
-        "Lucid Engine License\n\nSource-available: Use per EULA. Royalties apply post $1M revenue.\nSDK portions MIT."
-    )
-    (base / "lucid-engine" / "build" / "lucid-stack-builder.py").write_text(
-        "#!/usr/bin/env python3\n\nimport os\n\n# Auto-generate build configs\nprint('Building Lucid stacks...')\n# TODO: Implement\n"
-    )
-    (base / ".gitignore").write_text(
-        "# Builds\nbuilds/\ntarget/\n\n# Content temps\nContent/*.tmp\n\n# IDE\n.vscode/\n.idea/\n\n# Logs\nTelemetry/*.log\n"
-    )
+    create_directory_tree(str(base), _TREE, created=created)
+    stamp.write_text(_TREE_HASH)
 
     print(f"Scaffolded Lucid Engine in {base.absolute()} 🚀")
     print("Next: cd lucid-engine; cargo build --workspace && cmake -B build")
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    if sys.argv[1:] == ["--emit-sh"]:
+        sys.stdout.write(generate_shell_script())
+    elif len(sys.argv) > 1:
         main(sys.argv[1])
     else:
         main()